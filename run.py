@@ -14,7 +14,11 @@ import subprocess
 import sys
 import os
 import re
-import yaml
+import json
+import base64
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Colors for terminal output
@@ -27,29 +31,136 @@ class Colors:
     BOLD = '\033[1m'
     END = '\033[0m'
 
+# Pre-colored status icons used in the check report
+_ICON_OK = f"{Colors.GREEN}✅{Colors.END}"
+_ICON_PENDING = f"{Colors.YELLOW}⏳{Colors.END}"
+_TICK = f"{Colors.GREEN}✓{Colors.END}"
+_CROSS = f"{Colors.RED}✗{Colors.END}"
+
 # For Windows compatibility
 if sys.platform == 'win32':
     os.system('color')  # Enable ANSI colors on Windows
     # Fix Unicode encoding on Windows
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 
+# YAML loader class, picked on first use so commands that never parse
+# manifests (like --clean) don't pay for importing yaml
+_YamlLoader = None
+
+# Keys the ConfigMap must define
+REQUIRED_CONFIG_KEYS = frozenset(("FLASK_ENV", "LOG_LEVEL", "APP_NAME"))
+
+# On-disk copy of the parsed manifests, so re-runs only re-parse edited files
+_DISK_CACHE_FILE = Path(__file__).parent / ".run_cache.json"
+_disk_cache = None
+_disk_cache_dirty = False
+_disk_cache_lock = threading.Lock()
 
-def print_header():
+
+def print_header(file=None):
     """Print the challenge header."""
-    print(f"\n{Colors.CYAN}{'='*60}{Colors.END}")
-    print(f"{Colors.BOLD}{Colors.CYAN}  ☸️  Kubernetes Basics Challenge{Colors.END}")
-    print(f"{Colors.CYAN}{'='*60}{Colors.END}\n")
+    print(f"\n{Colors.CYAN}{'='*60}{Colors.END}", file=file)
+    print(f"{Colors.BOLD}{Colors.CYAN}  ☸️  Kubernetes Basics Challenge{Colors.END}", file=file)
+    print(f"{Colors.CYAN}{'='*60}{Colors.END}\n", file=file)
+
+
+def _get_disk_cache():
+    """Return the on-disk manifest cache, reading it on first use."""
+    global _disk_cache
+    with _disk_cache_lock:
+        if _disk_cache is None:
+            try:
+                with open(_DISK_CACHE_FILE, 'rb') as f:
+                    _disk_cache = json.loads(f.read())
+                if not isinstance(_disk_cache, dict):
+                    _disk_cache = {}
+            except (OSError, ValueError):
+                _disk_cache = {}
+        return _disk_cache
+
+
+def save_disk_cache():
+    """Write the on-disk manifest cache if any entries changed."""
+    global _disk_cache_dirty
+    with _disk_cache_lock:
+        if not _disk_cache_dirty:
+            return
+        try:
+            with open(_DISK_CACHE_FILE, 'w') as f:
+                json.dump(_disk_cache, f)
+            _disk_cache_dirty = False
+        except OSError:
+            pass
+
+
+def _get_yaml_loader():
+    """Return the YAML loader, preferring the libyaml C loader when available."""
+    global _YamlLoader
+    if _YamlLoader is None:
+        try:
+            from yaml import CSafeLoader as loader
+        except ImportError:
+            from yaml import SafeLoader as loader
+        _YamlLoader = loader
+    return _YamlLoader
 
 
 def load_yaml_file(file_path):
     """Load and parse a YAML file."""
+    global _disk_cache_dirty
+    file_path = Path(file_path)
     try:
-        with open(file_path, 'r') as f:
-            return yaml.safe_load(f)
+        st = file_path.stat()
+        disk_cache = _get_disk_cache()
+        disk_entry = disk_cache.get(str(file_path))
+        if (isinstance(disk_entry, dict)
+                and disk_entry.get("mtime") == st.st_mtime
+                and disk_entry.get("size") == st.st_size):
+            # A malformed entry is treated as a cache miss
+            try:
+                manifest = json.loads(disk_entry["parsed"])
+            except (KeyError, TypeError, ValueError):
+                pass
+            else:
+                return manifest
+
+        with open(file_path, 'rb') as f:
+            data = f.read()
+
+        # Only import yaml when a file actually has to be parsed
+        import yaml
+        try:
+            manifest = yaml.load(data, Loader=_get_yaml_loader())
+        except yaml.YAMLError as e:
+            # Parsing from bytes leaves the marks unnamed; point them at the file
+            for attr in ("problem_mark", "context_mark"):
+                mark = getattr(e, attr, None)
+                if mark is not None:
+                    setattr(e, attr, yaml.Mark(str(file_path), mark.index, mark.line,
+                                               mark.column, None, None))
+            return {"error": str(e)}
+
+        # Only cache manifests that survive a JSON round trip unchanged
+        # (e.g. non-string mapping keys would come back as strings)
+        try:
+            parsed = json.dumps(manifest)
+            if json.loads(parsed) != manifest:
+                parsed = None
+        except (TypeError, ValueError):
+            parsed = None
+        with _disk_cache_lock:
+            if parsed is not None:
+                disk_cache[str(file_path)] = {
+                    "mtime": st.st_mtime,
+                    "size": st.st_size,
+                    "parsed": parsed,
+                }
+            else:
+                disk_cache.pop(str(file_path), None)
+            _disk_cache_dirty = True
+        return manifest
     except FileNotFoundError:
         return None
-    except yaml.YAMLError as e:
-        return {"error": str(e)}
 
 
 def check_deployment(manifest):
@@ -225,19 +336,15 @@ def check_configmap(manifest):
     else:
         points += 2
 
-    required_keys = ["FLASK_ENV", "LOG_LEVEL", "APP_NAME"]
-    found_keys = []
-    for key in required_keys:
-        if key in data:
-            found_keys.append(key)
+    present = REQUIRED_CONFIG_KEYS & data.keys()
+    missing = REQUIRED_CONFIG_KEYS - present
 
-    if len(found_keys) == len(required_keys):
-        checks.append(("All config keys", True, ", ".join(found_keys)))
+    if not missing:
+        checks.append(("All config keys", True, ", ".join(sorted(present))))
         points += 10
     else:
-        missing = set(required_keys) - set(found_keys)
-        checks.append(("All config keys", False, f"Missing: {', '.join(missing)}"))
-        points += len(found_keys) * 3  # Partial credit
+        checks.append(("All config keys", False, f"Missing: {', '.join(sorted(missing))}"))
+        points += len(present) * 3  # Partial credit
 
     return checks, points, max_points
 
@@ -276,10 +383,9 @@ def check_secret(manifest):
 
     if api_key and api_key != "REPLACE-WITH-BASE64-ENCODED-VALUE":
         # Try to validate it's base64
-        import base64
         try:
             decoded = base64.b64decode(api_key).decode('utf-8')
-            if len(decoded) > 0:
+            if decoded:
                 checks.append(("api-key (base64)", True, f"Valid ({len(decoded)} chars decoded)"))
                 points += 10
             else:
@@ -294,101 +400,113 @@ def check_secret(manifest):
 
 def check_all_manifests():
     """Check all Kubernetes manifests."""
-    print_header()
-    print(f"  {Colors.BOLD}Checking your Kubernetes manifests...{Colors.END}\n")
-
-    k8s_dir = Path(__file__).parent / "k8s"
+    # Build the whole report in memory and write it to stdout in one go
+    buf = io.StringIO()
+    print_header(file=buf)
+    print(f"  {Colors.BOLD}Checking your Kubernetes manifests...{Colors.END}\n", file=buf)
 
-    total_points = 0
-    max_total = 0
-
-    checks_by_file = [
-        ("deployment.yaml", "Deployment", check_deployment, 25),
-        ("service.yaml", "Service", check_service, 20),
-        ("configmap.yaml", "ConfigMap", check_configmap, 15),
-        ("secret.yaml", "Secret", check_secret, 15),
-    ]
-
-    for filename, display_name, check_func, max_pts in checks_by_file:
-        file_path = k8s_dir / filename
-        manifest = load_yaml_file(file_path)
-        checks, points, max_points = check_func(manifest)
-
-        total_points += points
-        max_total += max_points
-
-        # Print results
-        status_icon = f"{Colors.GREEN}✅{Colors.END}" if points == max_points else f"{Colors.YELLOW}⏳{Colors.END}"
-        print(f"  {status_icon} {Colors.BOLD}{display_name}{Colors.END} ({points}/{max_points} points)")
-
-        for check_name, passed, detail in checks:
-            icon = f"{Colors.GREEN}✓{Colors.END}" if passed else f"{Colors.RED}✗{Colors.END}"
-            detail_str = f" - {detail}" if detail else ""
-            print(f"      {icon} {check_name}{detail_str}")
-
-        print()
-
-    # Progress bar
-    progress_pct = int((total_points / max_total) * 100) if max_total > 0 else 0
-    bar_filled = int(progress_pct / 5)
-    bar_empty = 20 - bar_filled
-
-    bar_color = Colors.GREEN if progress_pct >= 80 else Colors.YELLOW
-    print(f"  {Colors.BOLD}Score:{Colors.END}")
-    print(f"  {bar_color}{'█' * bar_filled}{'░' * bar_empty}{Colors.END} {total_points}/{max_total} points ({progress_pct}%)")
-
-    if progress_pct == 100:
-        print(f"\n  {Colors.GREEN}{Colors.BOLD}🎉 All manifests complete!{Colors.END}")
-        print(f"  {Colors.CYAN}Run 'python run.py --deploy' to test in a real cluster!{Colors.END}")
-    elif progress_pct >= 80:
-        print(f"\n  {Colors.GREEN}Almost there! Check the items marked with ✗{Colors.END}")
-    else:
-        print(f"\n  {Colors.CYAN}Keep going! See README.md for guidance.{Colors.END}")
+    # Write whatever was collected even if a check raises part-way through
+    try:
+        k8s_dir = Path(__file__).parent / "k8s"
+
+        total_points = 0
+        max_total = 0
+
+        checks_by_file = [
+            ("deployment.yaml", "Deployment", check_deployment, 25),
+            ("service.yaml", "Service", check_service, 20),
+            ("configmap.yaml", "ConfigMap", check_configmap, 15),
+            ("secret.yaml", "Secret", check_secret, 15),
+        ]
+
+        # Load all manifests up front, then run the checks on the main thread
+        file_paths = [k8s_dir / filename for filename, _, _, _ in checks_by_file]
+        with ThreadPoolExecutor(max_workers=len(file_paths)) as executor:
+            manifests = list(executor.map(load_yaml_file, file_paths))
+        save_disk_cache()
+
+        for (filename, display_name, check_func, max_pts), manifest in zip(checks_by_file, manifests):
+            checks, points, max_points = check_func(manifest)
+
+            total_points += points
+            max_total += max_points
+
+            # Print results
+            status_icon = _ICON_OK if points == max_points else _ICON_PENDING
+            print(f"  {status_icon} {Colors.BOLD}{display_name}{Colors.END} ({points}/{max_points} points)", file=buf)
+
+            for check_name, passed, detail in checks:
+                icon = _TICK if passed else _CROSS
+                detail_str = f" - {detail}" if detail else ""
+                print(f"      {icon} {check_name}{detail_str}", file=buf)
+
+            print(file=buf)
+
+        # Progress bar
+        progress_pct = int((total_points / max_total) * 100) if max_total > 0 else 0
+        bar_filled = int(progress_pct / 5)
+        bar_empty = 20 - bar_filled
+
+        bar_color = Colors.GREEN if progress_pct >= 80 else Colors.YELLOW
+        print(f"  {Colors.BOLD}Score:{Colors.END}", file=buf)
+        print(f"  {bar_color}{'█' * bar_filled}{'░' * bar_empty}{Colors.END} {total_points}/{max_total} points ({progress_pct}%)", file=buf)
+
+        if progress_pct == 100:
+            print(f"\n  {Colors.GREEN}{Colors.BOLD}🎉 All manifests complete!{Colors.END}", file=buf)
+            print(f"  {Colors.CYAN}Run 'python run.py --deploy' to test in a real cluster!{Colors.END}", file=buf)
+        elif progress_pct >= 80:
+            print(f"\n  {Colors.GREEN}Almost there! Check the items marked with ✗{Colors.END}", file=buf)
+        else:
+            print(f"\n  {Colors.CYAN}Keep going! See README.md for guidance.{Colors.END}", file=buf)
 
-    print()
-    return progress_pct == 100
+        print(file=buf)
+        return progress_pct == 100
+    finally:
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
 
 
-def check_kubectl():
-    """Check if kubectl is installed."""
+def _probe(cmd, timeout):
+    """Run a command and report whether it exited successfully."""
     try:
         result = subprocess.run(
-            ["kubectl", "version", "--client", "--short"],
-            capture_output=True,
-            text=True,
-            timeout=5
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=timeout
         )
         return result.returncode == 0
     except:
         return False
 
 
+def check_kubectl():
+    """Check if kubectl is installed."""
+    return _probe(["kubectl", "version", "--client", "--short"], 5)
+
+
 def check_kind():
     """Check if kind is installed."""
-    try:
-        result = subprocess.run(
-            ["kind", "version"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        return result.returncode == 0
-    except:
-        return False
+    return _probe(["kind", "version"], 5)
 
 
 def check_docker():
     """Check if Docker is running."""
-    try:
-        result = subprocess.run(
-            ["docker", "info"],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        return result.returncode == 0
-    except:
-        return False
+    return _probe(["docker", "info"], 10)
+
+
+def _run_streamed(cmd):
+    """Run a command, echoing its combined output as it arrives. Returns the exit code."""
+    with subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1
+    ) as process:
+        for line in process.stdout:
+            print(f"      {line}", end="")
+    return process.returncode
 
 
 def deploy_to_cluster():
@@ -399,17 +517,23 @@ def deploy_to_cluster():
     # Check prerequisites
     print(f"  {Colors.CYAN}Checking prerequisites...{Colors.END}")
 
-    if not check_docker():
+    # Run the probes concurrently so the wait is the slowest one, not the sum
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        docker_ok, kubectl_ok, kind_ok = executor.map(
+            lambda check: check(), [check_docker, check_kubectl, check_kind]
+        )
+
+    if not docker_ok:
         print(f"  {Colors.RED}❌ Docker is not running{Colors.END}")
         print(f"  {Colors.YELLOW}Start Docker Desktop and try again.{Colors.END}\n")
         return
 
-    if not check_kubectl():
+    if not kubectl_ok:
         print(f"  {Colors.RED}❌ kubectl not found{Colors.END}")
         print(f"  {Colors.YELLOW}See README.md Step 0 to install kubectl.{Colors.END}\n")
         return
 
-    if not check_kind():
+    if not kind_ok:
         print(f"  {Colors.RED}❌ kind not found{Colors.END}")
         print(f"  {Colors.YELLOW}See README.md Step 0 to install kind.{Colors.END}\n")
         return
@@ -424,35 +548,48 @@ def deploy_to_cluster():
         text=True
     )
 
-    if "k8s-challenge" not in result.stdout:
-        print(f"  {Colors.YELLOW}Creating kind cluster 'k8s-challenge'...{Colors.END}")
-        result = subprocess.run(
-            ["kind", "create", "cluster", "--name", "k8s-challenge"],
-            capture_output=True,
-            text=True
-        )
+    existing_clusters = set(result.stdout.split())
+    src_dir = Path(__file__).parent / "src"
+
+    # Cluster creation and the image build are independent until the image
+    # is loaded, so create the cluster in the background while building
+    cluster_future = None
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        if "k8s-challenge" not in existing_clusters:
+            print(f"  {Colors.YELLOW}Creating kind cluster 'k8s-challenge' in the background...{Colors.END}")
+            cluster_future = executor.submit(
+                subprocess.run,
+                ["kind", "create", "cluster", "--name", "k8s-challenge"],
+                capture_output=True,
+                text=True
+            )
+        else:
+            print(f"  {Colors.GREEN}✓ Cluster exists{Colors.END}")
+
+        # Build image
+        print(f"\n  {Colors.CYAN}Building Docker image...{Colors.END}")
+        build_ok = _run_streamed(["docker", "build", "-t", "k8s-challenge-app:latest", str(src_dir)]) == 0
+        if build_ok:
+            print(f"  {Colors.GREEN}✓ Image built{Colors.END}")
+        else:
+            print(f"  {Colors.RED}❌ Failed to build image{Colors.END}")
+
+        if cluster_future is not None and not cluster_future.done():
+            print(f"  {Colors.CYAN}Waiting for kind cluster creation to finish...{Colors.END}")
+
+    # Always report the cluster result, even if the build failed
+    if cluster_future is not None:
+        result = cluster_future.result()
         if result.returncode != 0:
             print(f"  {Colors.RED}❌ Failed to create cluster{Colors.END}")
             print(result.stderr)
             return
         print(f"  {Colors.GREEN}✓ Cluster created{Colors.END}")
-    else:
-        print(f"  {Colors.GREEN}✓ Cluster exists{Colors.END}")
 
-    # Build and load image
-    print(f"\n  {Colors.CYAN}Building Docker image...{Colors.END}")
-    src_dir = Path(__file__).parent / "src"
-    result = subprocess.run(
-        ["docker", "build", "-t", "k8s-challenge-app:latest", str(src_dir)],
-        capture_output=True,
-        text=True
-    )
-    if result.returncode != 0:
-        print(f"  {Colors.RED}❌ Failed to build image{Colors.END}")
-        print(result.stderr)
+    if not build_ok:
         return
-    print(f"  {Colors.GREEN}✓ Image built{Colors.END}")
 
+    # Load image
     print(f"  {Colors.CYAN}Loading image into kind...{Colors.END}")
     result = subprocess.run(
         ["kind", "load", "docker-image", "k8s-challenge-app:latest", "--name", "k8s-challenge"],
@@ -468,19 +605,10 @@ def deploy_to_cluster():
     # Apply manifests
     print(f"\n  {Colors.CYAN}Applying Kubernetes manifests...{Colors.END}")
     k8s_dir = Path(__file__).parent / "k8s"
-    result = subprocess.run(
-        ["kubectl", "apply", "-f", str(k8s_dir)],
-        capture_output=True,
-        text=True
-    )
-    if result.returncode != 0:
+    if _run_streamed(["kubectl", "apply", "--server-side", "--force-conflicts", "-f", str(k8s_dir)]) != 0:
         print(f"  {Colors.RED}❌ Failed to apply manifests{Colors.END}")
-        print(result.stderr)
         return
 
-    for line in result.stdout.strip().split('\n'):
-        print(f"      {line}")
-
     # Wait for deployment
     print(f"\n  {Colors.CYAN}Waiting for pods to be ready...{Colors.END}")
     result = subprocess.run(
@@ -520,7 +648,8 @@ def cleanup():
     k8s_dir = Path(__file__).parent / "k8s"
     subprocess.run(
         ["kubectl", "delete", "-f", str(k8s_dir), "--ignore-not-found"],
-        capture_output=True
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
     )
     print(f"  {Colors.GREEN}✓ Resources deleted{Colors.END}")
 
@@ -6,7 +6,9 @@ It has health endpoints and returns simple JSON responses.
 """
 
 import os
-from flask import Flask, jsonify
+
+import orjson
+from flask import Flask, Response
 
 app = Flask(__name__)
 
@@ -17,20 +19,46 @@ LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 API_KEY = os.getenv("API_KEY", "not-set")
 
 
+def _json_bytes(payload):
+    """Serialize a response payload to JSON bytes."""
+    return orjson.dumps(payload)
+
+
+def _json_response(payload):
+    """Build a JSON response for a payload computed per request."""
+    return Response(_json_bytes(payload), mimetype="application/json")
+
+
+# These payloads only depend on the environment, so encode them once at startup
+_HOME_JSON = _json_bytes({
+    "app": APP_NAME,
+    "environment": APP_ENV,
+    "message": "Welcome to the Kubernetes Challenge!",
+    "endpoints": {
+        "/": "This page",
+        "/health": "Health check endpoint",
+        "/config": "Show configuration (from ConfigMap)",
+        "/secret-check": "Verify secret is loaded"
+    }
+})
+
+_HEALTH_JSON = _json_bytes({
+    "status": "healthy",
+    "app": APP_NAME
+})
+
+_CONFIG_JSON = _json_bytes({
+    "app_name": APP_NAME,
+    "environment": APP_ENV,
+    "log_level": LOG_LEVEL,
+    "source": "ConfigMap (environment variables)"
+})
+
+
 @app.route("/")
 def home():
     """Home endpoint - returns app info."""
-    return jsonify({
-        "app": APP_NAME,
-        "environment": APP_ENV,
-        "message": "Welcome to the Kubernetes Challenge!",
-        "endpoints": {
-            "/": "This page",
-            "/health": "Health check endpoint",
-            "/config": "Show configuration (from ConfigMap)",
-            "/secret-check": "Verify secret is loaded"
-        }
-    })
+    return Response(_HOME_JSON, mimetype="application/json")
 
 
 @app.route("/health")
@@ -39,28 +67,20 @@ def health():
     Health check endpoint.
     Kubernetes will use this for liveness and readiness probes.
     """
-    return jsonify({
-        "status": "healthy",
-        "app": APP_NAME
-    })
+    return Response(_HEALTH_JSON, mimetype="application/json")
 
 
 @app.route("/config")
 def config():
     """Show configuration loaded from ConfigMap."""
-    return jsonify({
-        "app_name": APP_NAME,
-        "environment": APP_ENV,
-        "log_level": LOG_LEVEL,
-        "source": "ConfigMap (environment variables)"
-    })
+    return Response(_CONFIG_JSON, mimetype="application/json")
 
 
 @app.route("/secret-check")
 def secret_check():
     """Verify that the secret was loaded (without exposing the actual value)."""
     api_key_loaded = API_KEY != "not-set" and len(API_KEY) > 0
-    return jsonify({
+    return _json_response({
         "api_key_loaded": api_key_loaded,
         "api_key_length": len(API_KEY) if api_key_loaded else 0,
         "source": "Secret (environment variable)"
@@ -73,7 +93,7 @@ def ready():
     Readiness check - more detailed than health.
     In a real app, this might check database connections, etc.
     """
-    return jsonify({
+    return _json_response({
         "ready": True,
         "checks": {
             "config_loaded": APP_NAME != "K8s Challenge App",
@@ -83,6 +103,8 @@ def ready():
 
 
 if __name__ == "__main__":
+    # Local runs only: the container starts the app with Gunicorn (see the
+    # Dockerfile), which also honours PORT but never enables Flask debug mode
     port = int(os.getenv("PORT", 5000))
     debug = APP_ENV == "development"
     print(f"Starting {APP_NAME} on port {port} (env: {APP_ENV})")